@@ -1,9 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-# Import routers from the routes directory
-from routes import routing, parking, events, translation, webhooks
-
 
 def create_app() -> FastAPI:
     """
@@ -12,6 +9,11 @@ def create_app() -> FastAPI:
     Having an app factory makes it easy to plug this backend into
     different environments (local, tests, cloud functions, etc.).
     """
+    # Import routers from the routes directory. Imported here rather than at
+    # module level so spawned child processes that re-run this file as
+    # __mp_main__ (OCR workers, uvicorn reload) don't load the whole app.
+    from routes import routing, parking, events, translation, webhooks
+
     app = FastAPI(
         title="MARGSATHI Mobility Intelligence API",
         version="0.1.0",
@@ -79,7 +81,8 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+if __name__ != "__mp_main__":
+    app = create_app()
 
 
 if __name__ == "__main__":
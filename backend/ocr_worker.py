@@ -0,0 +1,195 @@
+"""
+EasyOCR reader setup and the OCR worker process loop for MARGSATHI.
+
+Kept apart from the translation router so spawned OCR workers only import
+easyocr, numpy and torch, not FastAPI and the rest of the app.
+"""
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class ReaderConfig(NamedTuple):
+    """Settings needed to build an EasyOCR reader, passed to worker processes"""
+    gpu: bool
+    quantize: bool
+    torchscript: bool
+    width: int
+    height: int
+    torch_threads: int = 0
+
+
+class SharedArray(NamedTuple):
+    """Reference to a numpy array placed in shared memory for an OCR worker"""
+    name: str
+    shape: tuple
+    dtype: str
+
+
+def to_shared(value, segments: list):
+    """
+    Copy numpy arrays (also inside lists) into new shared memory segments,
+    appending each segment to `segments`. Other values pass through.
+    """
+    if isinstance(value, np.ndarray):
+        shm = SharedMemory(create=True, size=max(1, value.nbytes))
+        segments.append(shm)
+        view = np.ndarray(value.shape, value.dtype, buffer=shm.buf)
+        view[...] = value
+        del view
+        return SharedArray(shm.name, value.shape, value.dtype.str)
+    if isinstance(value, list):
+        return [to_shared(item, segments) for item in value]
+    return value
+
+
+def from_shared(value, opened: list):
+    """Inverse of to_shared inside the worker: map segments back to arrays"""
+    if isinstance(value, SharedArray):
+        shm = SharedMemory(name=value.name)
+        opened.append(shm)
+        return np.ndarray(value.shape, np.dtype(value.dtype), buffer=shm.buf)
+    if isinstance(value, list):
+        return [from_shared(item, opened) for item in value]
+    return value
+
+
+def _trace_reader_models(reader, config: ReaderConfig) -> None:
+    """
+    Swap the reader's detector and recognizer for TorchScript traces.
+    Each model falls back to eager mode if tracing fails. The eager models
+    are kept on the reader so warm_up_reader can put them back if the traces
+    fail on real inputs.
+    """
+    import torch
+
+    reader._eager_models = (reader.detector, reader.recognizer)
+
+    def trace(model, *example_inputs):
+        # DataParallel wrappers (GPU) cannot be traced, trace the inner module
+        module = getattr(model, "module", model)
+        device = next(module.parameters()).device
+        example_inputs = tuple(t.to(device) for t in example_inputs)
+        with torch.no_grad():
+            return torch.jit.trace(module.eval(), example_inputs, check_trace=False)
+
+    try:
+        # EasyOCR pads detector input up to a multiple of 32
+        reader.detector = trace(
+            reader.detector,
+            torch.zeros(1, 3, -(-config.height // 32) * 32, -(-config.width // 32) * 32),
+        )
+        logger.info("EasyOCR detector traced to TorchScript")
+    except Exception as e:
+        logger.warning(f"TorchScript tracing of the detector failed, using eager mode: {e}")
+
+    try:
+        reader.recognizer = trace(
+            reader.recognizer,
+            torch.zeros(1, 1, getattr(reader, "imgH", 64), config.width),
+            torch.zeros(1, 1, dtype=torch.long),
+        )
+        logger.info("EasyOCR recognizer traced to TorchScript")
+    except Exception as e:
+        logger.warning(f"TorchScript tracing of the recognizer failed, using eager mode: {e}")
+
+
+def create_reader(config: ReaderConfig):
+    """Build an EasyOCR reader."""
+    import easyocr
+    # Initialize for English and Hindi by default, can add more
+    # cudnn_benchmark lets cuDNN pick the fastest conv kernels for our input sizes
+    logger.info(f"Initializing EasyOCR on {'GPU' if config.gpu else 'CPU'}... (this may take a moment on first run)")
+    reader = easyocr.Reader(
+        ['en', 'hi'],
+        gpu=config.gpu,
+        cudnn_benchmark=True,
+        quantize=config.quantize and not config.gpu,
+    )
+    if config.torchscript:
+        _trace_reader_models(reader, config)
+    return reader
+
+
+def _run_warm_up(reader, config: ReaderConfig) -> None:
+    reader.readtext(np.zeros((config.height, config.width, 3), np.uint8))
+    # A blank image has no text boxes, so run the recognizer directly on a
+    # batch of two crops with different widths as well
+    height = getattr(reader, "imgH", 64)
+    reader.recognize(
+        np.zeros((2 * height, config.width), np.uint8),
+        horizontal_list=[[0, config.width, 0, height], [0, config.width // 2, height, 2 * height]],
+        free_list=[],
+    )
+
+
+def warm_up_reader(reader, config: ReaderConfig) -> None:
+    """
+    Run dummy inputs through the detector and recognizer so lazy CUDA init
+    and the cuDNN auto-tuner happen before the first real request. This
+    also checks TorchScript traces: if they fail, the eager models are
+    restored and the warm-up is repeated with them.
+    """
+    try:
+        _run_warm_up(reader, config)
+    except Exception as e:
+        eager_models = getattr(reader, "_eager_models", None)
+        if eager_models is None:
+            raise
+        logger.warning(f"TorchScript models failed during warm-up, restoring eager models: {e}")
+        reader.detector, reader.recognizer = eager_models
+        reader._eager_models = None
+        _run_warm_up(reader, config)
+
+
+def run_worker(worker_id: int, config: ReaderConfig, tasks, results):
+    """
+    OCR worker process loop.
+    Once the reader is built and warmed up the worker reports
+    ("ready", worker_id, ok, error). If that fails it exits right away
+    instead of taking jobs it cannot run.
+    Jobs are (request_id, method, args, kwargs) tuples read from this
+    worker's own `tasks` queue; the worker calls the reader method and sends
+    ("done", worker_id, request_id, ok, result_or_error) on its `results`
+    pipe. A None job stops the worker.
+    Image arrays arrive as SharedArray references; the parent owns and
+    unlinks the segments, the worker only maps them.
+    """
+    try:
+        if config.torch_threads:
+            import torch
+            # Split CPU threads between workers instead of oversubscribing
+            torch.set_num_threads(config.torch_threads)
+        reader = create_reader(config)
+        warm_up_reader(reader, config)
+    except Exception as e:
+        error = f"OCR worker failed to initialize: {e}"
+        logger.error(error)
+        results.send(("ready", worker_id, False, error))
+        return
+    logger.info(f"OCR worker {worker_id} ready")
+    results.send(("ready", worker_id, True, None))
+
+    while True:
+        job = tasks.get()
+        if job is None:
+            break
+        request_id, method, args, kwargs = job
+        opened = []
+        try:
+            args = [from_shared(arg, opened) for arg in args]
+            results.send(("done", worker_id, request_id, True, getattr(reader, method)(*args, **kwargs)))
+        except Exception as e:
+            results.send(("done", worker_id, request_id, False, str(e)))
+        finally:
+            # Drop the array views before unmapping the segments
+            args = None
+            for shm in opened:
+                try:
+                    shm.close()
+                except BufferError:
+                    pass
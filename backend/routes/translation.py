@@ -2,16 +2,35 @@
 Enhanced Translation Module for MARGSATHI
 Supports real translation, image OCR, and multiple translation providers
 """
-from typing import Literal, Optional
+from typing import List, Literal, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
 from io import BytesIO
+import asyncio
+import atexit
+import hashlib
+import importlib.util
+import itertools
 import logging
+import multiprocessing
+import multiprocessing.connection
 import os
 import platform
+import threading
+import time
 from pathlib import Path
 
+import cv2
+import httpx
+import numpy as np
+import orjson
 from fastapi import APIRouter, UploadFile, File, HTTPException, Form
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
+from ocr_worker import ReaderConfig, create_reader, run_worker, to_shared, warm_up_reader
+
 # Translation providers
 from deep_translator import GoogleTranslator
 try:
@@ -22,12 +41,88 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# Configure Tesseract path for Windows
 # Configure OCR
 EASYOCR_READER = None
 
+# Set MARGSATHI_OCR_DEVICE to "cpu" or "cuda" to override auto-detection
+OCR_DEVICE = os.getenv("MARGSATHI_OCR_DEVICE", "auto").lower()
+
+# INT8 dynamic quantization of the EasyOCR models on CPU (roughly 2x faster,
+# half the memory). Ignored on GPU. Set MARGSATHI_OCR_QUANTIZE=0 to disable.
+# Model weights are downloaded to and cached in ~/.EasyOCR/model.
+OCR_QUANTIZE = os.getenv("MARGSATHI_OCR_QUANTIZE", "1").lower() not in ("0", "false", "no")
+
+# Trace the detector and recognizer to TorchScript at startup to cut eager-mode
+# Python overhead. Traces are recorded at one input shape and only checked by
+# the warm-up (eager models are restored if that fails); other shapes are not
+# guaranteed to trace correctly, so this is opt-in: MARGSATHI_OCR_TORCHSCRIPT=1.
+OCR_TORCHSCRIPT = os.getenv("MARGSATHI_OCR_TORCHSCRIPT", "0").lower() in ("1", "true", "yes")
+
+# Recognizer batch size and the fixed input size used for batched OCR
+OCR_BATCH_SIZE = int(os.getenv("MARGSATHI_OCR_BATCH_SIZE", "8"))
+OCR_BATCH_WIDTH = 800
+OCR_BATCH_HEIGHT = 600
+MAX_BATCH_IMAGES = 16
+
+# Uploads are downscaled so their longest side is at most this many pixels
+# before OCR. This trades accuracy for speed: EasyOCR's own detector limit
+# (canvas_size) is 2560, so images between this and 2560 px lose resolution
+# that small text may need. Raise it if signs are read poorly.
+OCR_MAX_SIDE = int(os.getenv("MARGSATHI_OCR_MAX_SIDE", "1024"))
+MAX_IMAGE_BYTES = int(os.getenv("MARGSATHI_MAX_IMAGE_BYTES", str(10 * 1024 * 1024)))
+
+# Blocking work runs off the event loop. Translators are network-bound so a
+# wide thread pool is fine; an in-process OCR reader is not thread-safe, so
+# its calls are serialised on a single dedicated thread. OCR concurrency is
+# controlled by MARGSATHI_OCR_PROCESSES below.
+TRANSLATE_THREADS = int(os.getenv("MARGSATHI_TRANSLATE_THREADS", "16"))
+
+# Number of OCR worker processes, each holding its own EasyOCR reader.
+# Every process loads the models, so memory/VRAM grows with this value (and
+# again per uvicorn worker). Set to 0 to run OCR inside the API process.
+OCR_PROCESSES = int(os.getenv("MARGSATHI_OCR_PROCESSES", "1"))
+
+# Seconds an image request waits for an OCR worker before giving up (504)
+OCR_TIMEOUT = float(os.getenv("MARGSATHI_OCR_TIMEOUT", "60"))
+
+TRANSLATE_EXECUTOR = ThreadPoolExecutor(max_workers=TRANSLATE_THREADS, thread_name_prefix="translate")
+OCR_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocr")
+
+
+async def run_blocking(executor: Optional[ThreadPoolExecutor], func, *args, **kwargs):
+    """Run a blocking call on the given executor (None for the loop default) and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+
+def _reader_config(gpu: bool, torch_threads: int = 0) -> ReaderConfig:
+    return ReaderConfig(
+        gpu=gpu,
+        quantize=OCR_QUANTIZE,
+        torchscript=OCR_TORCHSCRIPT,
+        width=OCR_BATCH_WIDTH,
+        height=OCR_BATCH_HEIGHT,
+        torch_threads=torch_threads,
+    )
+
+
+def _use_gpu() -> bool:
+    """Decide whether EasyOCR should run on CUDA."""
+    import torch
+    if OCR_DEVICE == "cpu":
+        return False
+    if OCR_DEVICE in ("cuda", "gpu") and not torch.cuda.is_available():
+        logger.warning("MARGSATHI_OCR_DEVICE=%s but CUDA is not available, using CPU", OCR_DEVICE)
+        return False
+    return torch.cuda.is_available()
+
+
+# Set once the OCR models are warmed up and requests run at full speed
+OCR_READY = threading.Event()
+
+
 def setup_ocr():
     """
     Initialize EasyOCR reader.
@@ -35,19 +130,323 @@ def setup_ocr():
     """
     global EASYOCR_READER
     try:
-        import easyocr
-        # Initialize for English and Hindi by default, can add more
-        # GPU=False to be safe on standard machines, set True if CUDA available
-        logger.info("Initializing EasyOCR... (this may take a moment on first run)")
-        EASYOCR_READER = easyocr.Reader(['en', 'hi'], gpu=False) 
+        config = _reader_config(_use_gpu())
+        EASYOCR_READER = create_reader(config)
         logger.info("EasyOCR initialized successfully")
+        # Warm up in the background on the OCR executor, so it never runs
+        # concurrently with a request on the same reader
+        OCR_EXECUTOR.submit(_warm_up_local_reader, config)
         return True
     except Exception as e:
         logger.error(f"Failed to initialize EasyOCR: {e}")
         return False
 
-# Check OCR availability at startup
-OCR_AVAILABLE = setup_ocr()
+
+def _warm_up_local_reader(config: ReaderConfig) -> None:
+    try:
+        warm_up_reader(EASYOCR_READER, config)
+    except Exception as e:
+        logger.error(f"EasyOCR warm-up failed: {e}")
+        return
+    logger.info("EasyOCR warm-up finished")
+    OCR_READY.set()
+
+
+def _resolve_future(future: asyncio.Future, result=None, error: Optional[Exception] = None) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+def _ocr_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="OCR engine (EasyOCR) is not initialized. Please check server logs."
+    )
+
+
+class _WorkerSlot:
+    """One OCR worker process with its own task queue and result pipe"""
+    __slots__ = ("process", "tasks", "results", "jobs", "closed")
+
+    def __init__(self, process, tasks, results):
+        self.process = process
+        self.tasks = tasks
+        self.results = results
+        self.jobs = set()
+        self.closed = False
+
+
+class OCRWorkerPool:
+    """
+    Dispatches OCR jobs to worker processes that each own an EasyOCR reader.
+    Every worker has its own task queue and result pipe, so a worker that
+    dies while holding a queue lock cannot block the others; a background
+    thread reads all result pipes and resolves the asyncio future of each
+    waiting request. Jobs go to the least busy worker.
+    Workers that fail to initialize exit; once all of them have, the pool
+    is unavailable and requests get a 503. A monitor thread watches for
+    workers that die after start-up (OOM kill, segfault), fails the jobs
+    assigned to them and starts a replacement with fresh channels.
+    """
+
+    def __init__(self, processes: int):
+        self.processes = processes
+        # CUDA cannot be re-initialised in a forked child, so always spawn
+        self._ctx = multiprocessing.get_context("spawn")
+        self._config = None
+        self._slots = []
+        self._ready = set()
+        self._failed = set()
+        self._stopping = threading.Event()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+
+    @property
+    def running(self) -> bool:
+        return bool(self._slots)
+
+    @property
+    def available(self) -> bool:
+        """True while at least one worker is starting up or ready"""
+        return self.running and len(self._failed) < self.processes
+
+    def start(self) -> None:
+        if self._slots:
+            return
+        # Split CPU threads between workers instead of oversubscribing
+        self._config = _reader_config(_use_gpu(), max(1, (os.cpu_count() or 1) // self.processes))
+        self._stopping.clear()
+        self._slots = [self._spawn(worker_id) for worker_id in range(self.processes)]
+        threading.Thread(target=self._drain_results, name="ocr-results", daemon=True).start()
+        threading.Thread(target=self._monitor_workers, name="ocr-monitor", daemon=True).start()
+        atexit.register(self.shutdown)
+        logger.info(f"Started {self.processes} OCR worker process(es)")
+
+    def _spawn(self, worker_id: int) -> _WorkerSlot:
+        tasks = self._ctx.Queue()
+        results, worker_end = self._ctx.Pipe(duplex=False)
+        process = self._ctx.Process(
+            target=run_worker,
+            args=(worker_id, self._config, tasks, worker_end),
+            name=f"ocr-worker-{worker_id}",
+            daemon=True,
+        )
+        process.start()
+        # Drop our copy of the write end so the pipe reports EOF if the worker dies
+        worker_end.close()
+        return _WorkerSlot(process, tasks, results)
+
+    @staticmethod
+    def _close_slot(slot: _WorkerSlot) -> None:
+        slot.closed = True
+        slot.results.close()
+        # Don't block on flushing jobs to a worker that is gone
+        slot.tasks.cancel_join_thread()
+        slot.tasks.close()
+
+    def _fail_jobs(self, request_ids, error: HTTPException) -> None:
+        """Fail the given requests with `error`. Needs _lock."""
+        for request_id in list(request_ids):
+            pending = self._pending.pop(request_id, None)
+            if pending is not None:
+                loop, future = pending
+                loop.call_soon_threadsafe(_resolve_future, future, None, error)
+
+    def _mark_failed(self, worker_id: int, error: str) -> None:
+        """Record a worker that could not start and fail its jobs. Needs _lock."""
+        self._failed.add(worker_id)
+        self._ready.discard(worker_id)
+        logger.error(f"OCR worker {worker_id} unavailable: {error}")
+        self._fail_jobs(self._slots[worker_id].jobs, _ocr_unavailable())
+        if len(self._failed) < self.processes:
+            return
+        logger.error("No OCR worker could be started, image translation is unavailable")
+        self._fail_jobs(self._pending, _ocr_unavailable())
+
+    def _update_ready(self) -> None:
+        """
+        Set OCR_READY once every worker that did not fail is warmed up, and
+        at least one is. Needs _lock.
+        """
+        if self._ready and len(self._ready) + len(self._failed) == self.processes:
+            if not OCR_READY.is_set():
+                logger.info(f"{len(self._ready)} of {self.processes} OCR workers ready")
+            OCR_READY.set()
+        else:
+            OCR_READY.clear()
+
+    def _drain_results(self) -> None:
+        while not self._stopping.is_set():
+            with self._lock:
+                connections = {
+                    slot.results: (worker_id, slot)
+                    for worker_id, slot in enumerate(self._slots)
+                    if not slot.closed
+                }
+            for connection in multiprocessing.connection.wait(list(connections), timeout=0.5):
+                worker_id, slot = connections[connection]
+                try:
+                    item = connection.recv()
+                except (EOFError, OSError):
+                    # Worker exited; the monitor deals with the process
+                    with self._lock:
+                        if not slot.closed:
+                            self._close_slot(slot)
+                    continue
+                
+                with self._lock:
+                    if item[0] == "ready":
+                        _, _, ok, error = item
+                        if ok:
+                            self._ready.add(worker_id)
+                        else:
+                            self._mark_failed(worker_id, error)
+                        self._update_ready()
+                        continue
+                    
+                    _, _, request_id, ok, payload = item
+                    slot.jobs.discard(request_id)
+                    pending = self._pending.pop(request_id, None)
+                if pending is None:
+                    continue
+                loop, future = pending
+                if ok:
+                    loop.call_soon_threadsafe(_resolve_future, future, payload)
+                else:
+                    loop.call_soon_threadsafe(_resolve_future, future, None, RuntimeError(payload))
+
+    def _monitor_workers(self) -> None:
+        while not self._stopping.wait(1.0):
+            with self._lock:
+                if self._stopping.is_set():
+                    return
+                for worker_id, slot in enumerate(self._slots):
+                    if slot.process.is_alive() or worker_id in self._failed:
+                        continue
+                    if worker_id not in self._ready:
+                        # Died while loading models: restarting would likely crash again
+                        self._mark_failed(worker_id, f"exited during start-up (exit code {slot.process.exitcode})")
+                        self._update_ready()
+                        continue
+                    
+                    logger.error(f"OCR worker {worker_id} died (exit code {slot.process.exitcode}), restarting it")
+                    self._ready.discard(worker_id)
+                    self._update_ready()
+                    self._fail_jobs(slot.jobs, HTTPException(
+                        status_code=503,
+                        detail="OCR worker crashed while processing the image, please retry"
+                    ))
+                    # The dead process may have held the locks of its queue or
+                    # pipe, so the replacement gets fresh ones
+                    if not slot.closed:
+                        self._close_slot(slot)
+                    self._slots[worker_id] = self._spawn(worker_id)
+
+    def _pick_worker(self) -> Optional[_WorkerSlot]:
+        """Least busy live worker, preferring ones that are warmed up. Needs _lock."""
+        candidates = [
+            (worker_id not in self._ready, len(slot.jobs), worker_id)
+            for worker_id, slot in enumerate(self._slots)
+            if worker_id not in self._failed and not slot.closed
+        ]
+        if not candidates:
+            return None
+        return self._slots[min(candidates)[2]]
+
+    async def submit(self, method: str, *args, **kwargs):
+        """
+        Run `reader.<method>(*args, **kwargs)` on a worker and await the result.
+        Array arguments are handed over through shared memory rather than
+        pickled through the queue.
+        """
+        if not self.available:
+            raise _ocr_unavailable()
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request_id = next(self._ids)
+        segments = []
+        slot = None
+        try:
+            args = tuple(to_shared(arg, segments) for arg in args)
+            with self._lock:
+                slot = self._pick_worker()
+                if slot is None:
+                    raise _ocr_unavailable()
+                slot.jobs.add(request_id)
+                self._pending[request_id] = (loop, future)
+                slot.tasks.put((request_id, method, args, kwargs))
+            return await asyncio.wait_for(future, OCR_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="OCR timed out, please retry")
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+                if slot is not None:
+                    slot.jobs.discard(request_id)
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+    def shutdown(self) -> None:
+        if not self._slots:
+            return
+        self._stopping.set()
+        with self._lock:
+            slots, self._slots = self._slots, []
+        for slot in slots:
+            if not slot.closed:
+                slot.tasks.put(None)
+        for slot in slots:
+            slot.process.join(timeout=5)
+            if slot.process.is_alive():
+                slot.process.terminate()
+            if not slot.closed:
+                self._close_slot(slot)
+        logger.info("OCR worker processes stopped")
+
+
+# Check OCR availability at startup. With worker processes the models are
+# loaded in the children once the app starts, so only check that EasyOCR
+# and torch are installed here; workers that then fail to start make the
+# pool unavailable.
+if OCR_PROCESSES > 0:
+    OCR_POOL = OCRWorkerPool(OCR_PROCESSES)
+    OCR_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ("easyocr", "torch"))
+else:
+    OCR_POOL = None
+    OCR_AVAILABLE = setup_ocr()
+
+
+@router.on_event("startup")
+async def start_ocr_workers():
+    if OCR_POOL is not None and OCR_AVAILABLE:
+        OCR_POOL.start()
+
+
+@router.on_event("shutdown")
+async def stop_ocr_workers():
+    if OCR_POOL is not None:
+        OCR_POOL.shutdown()
+
+
+def ocr_available() -> bool:
+    """Whether OCR requests can currently be served"""
+    if OCR_POOL is not None:
+        return OCR_AVAILABLE and OCR_POOL.available
+    return OCR_AVAILABLE
+
+
+async def run_ocr(method: str, *args, **kwargs):
+    """Run an EasyOCR reader method on the worker processes or the local reader"""
+    if OCR_POOL is not None:
+        return await OCR_POOL.submit(method, *args, **kwargs)
+    return await run_blocking(OCR_EXECUTOR, getattr(EASYOCR_READER, method), *args, **kwargs)
 
 
 
@@ -66,17 +465,13 @@ LANGUAGE_NAMES = {
     "gu": "Gujarati",
 }
 
-DEEP_TRANSLATOR_CODES = {
-    "en": "en",
-    "hi": "hi",
-    "bn": "bn",
-    "ta": "ta",
-    "te": "te",
-    "mr": "mr",
-    "kn": "kn",
-    "ml": "ml",
-    "gu": "gu",
-}
+
+def _provider_code(lang: str, default: str) -> str:
+    """
+    Map our language code to the Google/Deep Translator code. Our codes are
+    already the ISO codes Google uses, so this is a single membership check.
+    """
+    return lang if lang in LANGUAGE_NAMES else default
 
 
 class TranslationRequest(BaseModel):
@@ -121,12 +516,104 @@ class ImageTranslationResponse(BaseModel):
     is_mock: bool = False
 
 
+class ImageBatchTranslationResponse(BaseModel):
+    results: List[ImageTranslationResponse]
+    count: int
+
+
 class LanguageDetectionResponse(BaseModel):
     detected_lang: str
     language_name: str
     confidence: float
 
 
+# Translation cache: repeated UI strings and signs skip the upstream round-trip
+TRANSLATION_CACHE_SIZE = 10_000
+TRANSLATION_CACHE_TTL = 72 * 3600  # seconds
+
+_translation_cache: "OrderedDict[tuple, tuple[tuple, float]]" = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+
+def _cache_key(text: str, source_lang: str, target_lang: str, provider: str) -> tuple:
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return (digest, source_lang, target_lang, provider)
+
+
+def _cache_get(key: tuple) -> Optional[tuple]:
+    """Return the cached value for key, or None if missing or expired"""
+    with _translation_cache_lock:
+        entry = _translation_cache.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del _translation_cache[key]
+            return None
+        _translation_cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key: tuple, value: tuple) -> None:
+    with _translation_cache_lock:
+        _translation_cache[key] = (value, time.monotonic() + TRANSLATION_CACHE_TTL)
+        _translation_cache.move_to_end(key)
+        while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
+
+
+def cached_translation(provider: str):
+    """
+    Cache the result tuple of a translation function.
+    Entries are keyed by a hash of the text plus source, target and provider,
+    expire after TRANSLATION_CACHE_TTL and are evicted least-recently-used.
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(text: str, source_lang: str, target_lang: str) -> tuple:
+            key = _cache_key(text, source_lang, target_lang, provider)
+            value = _cache_get(key)
+            if value is None:
+                value = func(text, source_lang, target_lang)
+                _cache_put(key, value)
+            return value
+        return wrapper
+    return decorator
+
+
+# Translator clients are reused, but only within one thread: Deep Translator
+# stores the text being translated on the instance (self._url_params["q"])
+# before sending it, so sharing an instance across the translate pool would
+# let concurrent requests swap texts.
+_translator_local = threading.local()
+
+
+def _get_deep_translator(source_code: str, target_code: str) -> GoogleTranslator:
+    """Reuse one Deep Translator client per language pair in the calling thread"""
+    translators = getattr(_translator_local, "deep", None)
+    if translators is None:
+        translators = _translator_local.deep = {}
+    translator = translators.get((source_code, target_code))
+    if translator is None:
+        translator = translators[(source_code, target_code)] = GoogleTranslator(
+            source=source_code, target=target_code
+        )
+    return translator
+
+
+def _get_googletrans() -> "GoogleTransAPI":
+    """googletrans client for the calling thread, so its HTTP session is reused"""
+    translator = getattr(_translator_local, "googletrans", None)
+    if translator is None:
+        translator = _translator_local.googletrans = GoogleTransAPI()
+    return translator
+
+
+def _detect_with_googletrans(text: str):
+    return _get_googletrans().detect(text)
+
+
+@cached_translation("deep")
 def translate_with_deep_translator(
     text: str, 
     source_lang: str, 
@@ -134,10 +621,10 @@ def translate_with_deep_translator(
 ) -> tuple[str, float]:
     """Translate using Deep Translator (free, no API key needed)"""
     try:
-        source_code = DEEP_TRANSLATOR_CODES.get(source_lang, "auto")
-        target_code = DEEP_TRANSLATOR_CODES.get(target_lang, "en")
+        source_code = _provider_code(source_lang, "auto")
+        target_code = _provider_code(target_lang, "en")
         
-        translator = GoogleTranslator(source=source_code, target=target_code)
+        translator = _get_deep_translator(source_code, target_code)
         translated = translator.translate(text)
         
         return translated, 0.95
@@ -146,12 +633,194 @@ def translate_with_deep_translator(
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
 
 
-def translate_with_googletrans(
+# Async Google Translate client used by the 'deep' provider. It talks to the
+# same free endpoint as Deep Translator, without holding a thread per request.
+GOOGLE_TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        # Keep to options httpx 0.13 (pinned by googletrans) also understands
+        _http_client = httpx.AsyncClient(http2=True, timeout=httpx.Timeout(10.0))
+    return _http_client
+
+
+@router.on_event("shutdown")
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+async def _google_translate_request(text: str, source_lang: str, target_lang: str) -> str:
+    """Translate text with one request to the free Google Translate endpoint"""
+    response = await _get_http_client().post(
+        GOOGLE_TRANSLATE_URL,
+        params={
+            "client": "gtx",
+            "sl": _provider_code(source_lang, "auto"),
+            "tl": _provider_code(target_lang, "en"),
+            "dt": "t",
+        },
+        data={"q": text},
+    )
+    response.raise_for_status()
+    # First element holds [translated, original, ...] per sentence
+    return "".join(segment[0] for segment in response.json()[0] if segment[0])
+
+
+# Dynamic batching of upstream requests: texts for the same language pair
+# arriving within the window are sent together in one request
+TRANSLATE_BATCH_WINDOW = float(os.getenv("MARGSATHI_TRANSLATE_BATCH_WINDOW_MS", "5")) / 1000
+TRANSLATE_BATCH_SIZE = int(os.getenv("MARGSATHI_TRANSLATE_BATCH_SIZE", "32"))
+TRANSLATE_BATCH_MAX_CHARS = 5000
+
+
+class _PendingBatch:
+    __slots__ = ("items", "chars", "timer")
+
+    def __init__(self):
+        self.items: list[tuple[str, asyncio.Future]] = []
+        self.chars = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class TranslationBatcher:
+    """
+    Merges concurrent translations for the same language pair into one
+    upstream request. Queued texts are joined with SEPARATOR, translated
+    together and split back apart. Texts without an explicit source
+    language, or containing MARKER, skip batching.
+    If the split does not line up with the inputs, each text is translated
+    on its own instead.
+    """
+
+    MARKER = "§§§"
+    SEPARATOR = f"\n{MARKER}\n"
+
+    def __init__(self, translate, window: float, max_items: int, max_chars: int):
+        self._translate = translate
+        self.window = window
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self._pending: dict[tuple[str, str], _PendingBatch] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def translate(self, text: str, source_lang: str, target_lang: str) -> str:
+        if source_lang == "auto" or self.MARKER in text:
+            # Google detects one source language per request, so auto-detect
+            # texts cannot share a batch; a marker in the text would break
+            # the split for the whole batch. Send these on their own.
+            return await self._translate(text, source_lang, target_lang)
+        
+        loop = asyncio.get_running_loop()
+        key = (source_lang, target_lang)
+        
+        batch = self._pending.get(key)
+        if batch is not None and batch.chars + len(text) > self.max_chars:
+            self._flush(key)
+            batch = None
+        if batch is None:
+            batch = self._pending[key] = _PendingBatch()
+            batch.timer = loop.call_later(self.window, self._flush, key)
+        
+        future = loop.create_future()
+        batch.items.append((text, future))
+        batch.chars += len(text) + len(self.SEPARATOR)
+        if len(batch.items) >= self.max_items:
+            self._flush(key)
+        return await future
+
+    def _flush(self, key: tuple[str, str]) -> None:
+        batch = self._pending.pop(key, None)
+        if batch is None:
+            return
+        batch.timer.cancel()
+        task = asyncio.ensure_future(self._run(key, batch.items))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, key: tuple[str, str], items: list[tuple[str, asyncio.Future]]) -> None:
+        source_lang, target_lang = key
+        texts = [text for text, _ in items]
+        
+        results = None
+        if len(texts) > 1:
+            try:
+                merged = await self._translate(self.SEPARATOR.join(texts), source_lang, target_lang)
+                parts = [part.strip() for part in merged.split(self.MARKER)]
+                if len(parts) == len(texts):
+                    results = parts
+                else:
+                    logger.debug(f"Batched translation split into {len(parts)} parts for {len(texts)} texts, retrying individually")
+            except Exception as e:
+                logger.debug(f"Batched translation failed, retrying individually: {e}")
+        if results is None:
+            results = await asyncio.gather(
+                *(self._translate(text, source_lang, target_lang) for text in texts),
+                return_exceptions=True,
+            )
+        
+        for (_, future), result in zip(items, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+_DEEP_BATCHER = TranslationBatcher(
+    _google_translate_request,
+    window=TRANSLATE_BATCH_WINDOW,
+    max_items=TRANSLATE_BATCH_SIZE,
+    max_chars=TRANSLATE_BATCH_MAX_CHARS,
+)
+
+
+async def translate_with_deep_translator_async(
     text: str,
     source_lang: str,
     target_lang: str
 ) -> tuple[str, float]:
-    """Translate using googletrans library (free, uses Google Translate)"""
+    """
+    Async version of translate_with_deep_translator sharing its cache.
+    Requests are batched with others for the same language pair. Falls back
+    to the Deep Translator library on a thread if the direct request fails.
+    """
+    key = _cache_key(text, source_lang, target_lang, "deep")
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    
+    try:
+        translated = await _DEEP_BATCHER.translate(text, source_lang, target_lang)
+    except Exception as e:
+        logger.warning(f"Async Google Translate request failed, using Deep Translator: {e}")
+        return await run_blocking(
+            TRANSLATE_EXECUTOR, translate_with_deep_translator,
+            text, source_lang, target_lang
+        )
+    
+    value = (translated, 0.95)
+    _cache_put(key, value)
+    return value
+
+
+@cached_translation("google")
+def translate_with_googletrans(
+    text: str,
+    source_lang: str,
+    target_lang: str
+) -> tuple[str, float, str]:
+    """
+    Translate using googletrans library (free, uses Google Translate).
+    Returns (translated_text, confidence, source_lang); with source "auto"
+    the source is the language Google detected, from the same request.
+    """
     if not GOOGLETRANS_AVAILABLE:
         raise HTTPException(
             status_code=503,
@@ -159,14 +828,10 @@ def translate_with_googletrans(
         )
     
     try:
-        translator = GoogleTransAPI()
-        result = translator.translate(
-            text,
-            src=source_lang if source_lang != "auto" else None,
-            dest=target_lang
-        )
+        translator = _get_googletrans()
+        result = translator.translate(text, src=source_lang, dest=target_lang)
         confidence = getattr(result, 'confidence', 0.9)
-        return result.text, confidence
+        return result.text, confidence, result.src
     except Exception as e:
         logger.error(f"Google Translate error: {e}")
         raise HTTPException(status_code=500, detail=f"Google Translate failed: {str(e)}")
@@ -178,6 +843,88 @@ def mock_translate(text: str, target_lang: str) -> tuple[str, float]:
     return f"{marker} {text}", 1.0
 
 
+PROVIDER_NAMES = {
+    "deep": "deep-translator",
+    "google": "google-translate",
+    "mock": "mock",
+}
+
+
+def _load_image(file: UploadFile) -> np.ndarray:
+    """
+    Decode an upload into a BGR array once, so EasyOCR does not re-parse it.
+    Reads straight from the spooled upload file (blocking, run it off the
+    event loop) and rejects files over MAX_IMAGE_BYTES before decoding.
+    Images whose longest side exceeds OCR_MAX_SIDE are shrunk to it, keeping
+    the aspect ratio.
+    """
+    too_large = HTTPException(
+        status_code=413,
+        detail=f"Image '{file.filename}' is larger than {MAX_IMAGE_BYTES} bytes"
+    )
+    if file.size is not None and file.size > MAX_IMAGE_BYTES:
+        raise too_large
+    
+    file.file.seek(0)
+    data = file.file.read(MAX_IMAGE_BYTES + 1)
+    if len(data) > MAX_IMAGE_BYTES:
+        raise too_large
+    
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise HTTPException(status_code=400, detail=f"Could not decode image '{file.filename}'")
+    
+    height, width = image.shape[:2]
+    scale = OCR_MAX_SIDE / max(height, width)
+    if scale < 1:
+        image = cv2.resize(
+            image,
+            (max(1, round(width * scale)), max(1, round(height * scale))),
+            interpolation=cv2.INTER_AREA,
+        )
+    return image
+
+
+def _collect_ocr_results(results) -> tuple[str, Optional[float]]:
+    """Join EasyOCR [box, text, confidence] results into text and average confidence"""
+    if not results:
+        return "", None
+    
+    extracted_parts = [text for _, text, _ in results]
+    confidences = np.fromiter((conf for _, _, conf in results), np.float64, count=len(results))
+    ocr_confidence = float(confidences.mean())
+    
+    # Only build the joined string when there is text to return
+    if not any(part.strip() for part in extracted_parts):
+        return "", ocr_confidence
+    return " ".join(extracted_parts).strip(), ocr_confidence
+
+
+async def _translate_extracted_text(
+    text: str,
+    source_lang: str,
+    target_lang: str,
+    provider: str
+) -> tuple[str, bool, str, str]:
+    """
+    Translate OCR output, returning
+    (translated_text, is_mock, provider_name, source_lang)
+    """
+    if provider == "mock":
+        translated_text, _ = mock_translate(text, target_lang)
+    elif provider == "google":
+        translated_text, _, source_lang = await run_blocking(
+            TRANSLATE_EXECUTOR, translate_with_googletrans,
+            text, source_lang, target_lang
+        )
+    else:
+        provider = "deep"
+        translated_text, _ = await translate_with_deep_translator_async(text, source_lang, target_lang)
+    if source_lang == "auto":
+        source_lang = "en"
+    return translated_text, provider == "mock", PROVIDER_NAMES[provider], source_lang
+
+
 @router.post(
     "/translate",
     response_model=TranslationResponse,
@@ -196,33 +943,44 @@ async def translate_text(payload: TranslationRequest) -> TranslationResponse:
     target_lang = payload.target_lang
     
     if payload.provider == "mock":
+        # Demo/health-check path: build the JSON directly and skip response
+        # model validation entirely
         translated_text, confidence = mock_translate(payload.text, target_lang)
-        is_mock = True
-        provider = "mock"
+        return ORJSONResponse({
+            "original_text": payload.text,
+            "translated_text": translated_text,
+            "source_lang": source_lang if source_lang != "auto" else "en",
+            "target_lang": target_lang,
+            "provider": "mock",
+            "confidence": confidence,
+            "is_mock": True,
+        })
     elif payload.provider == "google":
-        translated_text, confidence = translate_with_googletrans(
+        # googletrans reports the detected source with the translation,
+        # so auto-detection costs no extra round-trip
+        translated_text, confidence, source_lang = await run_blocking(
+            TRANSLATE_EXECUTOR, translate_with_googletrans,
             payload.text, source_lang, target_lang
         )
-        is_mock = False
         provider = "google-translate"
     else:  # default to deep translator
-        translated_text, confidence = translate_with_deep_translator(
+        translated_text, confidence = await translate_with_deep_translator_async(
             payload.text, source_lang, target_lang
         )
-        is_mock = False
         provider = "deep-translator"
     
     if source_lang == "auto":
         source_lang = "en"
     
-    return TranslationResponse(
+    # Every field is already the right type, no need to validate twice
+    return TranslationResponse.model_construct(
         original_text=payload.text,
         translated_text=translated_text,
         source_lang=source_lang,
         target_lang=target_lang,
         provider=provider,
         confidence=confidence,
-        is_mock=is_mock,
+        is_mock=False,
     )
 
 
@@ -245,61 +1003,39 @@ async def translate_image(
     Requires Tesseract OCR to be installed.
     """
     # Check if OCR is available
-    if not OCR_AVAILABLE:
-        raise HTTPException(
-            status_code=503,
-            detail="OCR engine (EasyOCR) is not initialized. Please check server logs."
-        )
+    if not ocr_available():
+        raise _ocr_unavailable()
     
     if not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="File must be an image")
     
     try:
-        image_data = await file.read()
+        image = await run_blocking(None, _load_image, file)
         
         # Perform OCR using EasyOCR
         # detail=1 returns [box, text, confidence]
-        results = EASYOCR_READER.readtext(image_data, detail=1)
-        
-        # Extract text and calculate average confidence
-        extracted_parts = []
-        confidences = []
+        results = await run_ocr(
+            "readtext", image, detail=1, batch_size=OCR_BATCH_SIZE
+        )
         
-        for _, text, conf in results:
-            extracted_parts.append(text)
-            confidences.append(conf)
-            
-        extracted_text = " ".join(extracted_parts)
+        extracted_text, ocr_confidence = _collect_ocr_results(results)
         
-        if not extracted_text.strip():
+        if not extracted_text:
             raise HTTPException(
                 status_code=400,
                 detail="No text found in image. Please upload an image with clear text."
             )
         
-        # Calculate average confidence
-        ocr_confidence = sum(confidences) / len(confidences) if confidences else None
-        
         # Translate extracted text
         source = source_lang or "auto"
+        translated_text, is_mock, provider_name, detected_source = await _translate_extracted_text(
+            extracted_text, source, target_lang, provider
+        )
         
-        if provider == "mock":
-            translated_text, _ = mock_translate(extracted_text, target_lang)
-            is_mock = True
-            provider_name = "mock"
-        elif provider == "google":
-            translated_text, _ = translate_with_googletrans(extracted_text, source, target_lang)
-            is_mock = False
-            provider_name = "google-translate"
-        else:
-            translated_text, _ = translate_with_deep_translator(extracted_text, source, target_lang)
-            is_mock = False
-            provider_name = "deep-translator"
-        
-        return ImageTranslationResponse(
-            extracted_text=extracted_text.strip(),
+        return ImageTranslationResponse.model_construct(
+            extracted_text=extracted_text,
             translated_text=translated_text,
-            source_lang=source if source != "auto" else "en",
+            source_lang=detected_source,
             target_lang=target_lang,
             provider=provider_name,
             ocr_confidence=ocr_confidence,
@@ -313,6 +1049,79 @@ async def translate_image(
         raise HTTPException(status_code=500, detail=f"Failed to process image: {str(e)}")
 
 
+@router.post(
+    "/translate-image-batch",
+    response_model=ImageBatchTranslationResponse,
+    summary="Extract text from several images and translate",
+)
+async def translate_image_batch(
+    files: List[UploadFile] = File(..., description="Image files containing text"),
+    target_lang: LanguageCode = Form(..., description="Target language"),
+    source_lang: Optional[LanguageCode] = Form(None, description="Source language"),
+    provider: Literal["deep", "google", "mock"] = Form("deep", description="Translation provider"),
+) -> ImageBatchTranslationResponse:
+    """
+    Batched OCR + Translation endpoint.
+    All images are resized to a common size and recognised in a single
+    EasyOCR batch, which keeps the GPU busy instead of running one image
+    per request. Images without text come back with empty strings.
+    """
+    if not ocr_available():
+        raise _ocr_unavailable()
+    
+    if len(files) > MAX_BATCH_IMAGES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many images, at most {MAX_BATCH_IMAGES} per batch"
+        )
+    
+    for file in files:
+        if not file.content_type.startswith("image/"):
+            raise HTTPException(status_code=400, detail=f"File '{file.filename}' must be an image")
+    
+    try:
+        images = await asyncio.gather(*(run_blocking(None, _load_image, file) for file in files))
+        
+        batch_results = await run_ocr(
+            "readtext_batched",
+            images,
+            n_width=OCR_BATCH_WIDTH,
+            n_height=OCR_BATCH_HEIGHT,
+            batch_size=OCR_BATCH_SIZE,
+            detail=1,
+        )
+        
+        source = source_lang or "auto"
+        collected = [_collect_ocr_results(results) for results in batch_results]
+        
+        async def translate_one(text: str) -> tuple[str, bool, str, str]:
+            if not text:
+                return "", provider == "mock", PROVIDER_NAMES[provider], source if source != "auto" else "en"
+            return await _translate_extracted_text(text, source, target_lang, provider)
+        
+        translations = await asyncio.gather(*(translate_one(text) for text, _ in collected))
+        
+        responses = []
+        for (extracted_text, ocr_confidence), (translated_text, is_mock, provider_name, detected_source) in zip(collected, translations):
+            responses.append(ImageTranslationResponse.model_construct(
+                extracted_text=extracted_text,
+                translated_text=translated_text,
+                source_lang=detected_source,
+                target_lang=target_lang,
+                provider=provider_name,
+                ocr_confidence=ocr_confidence,
+                is_mock=is_mock,
+            ))
+        
+        return ImageBatchTranslationResponse.model_construct(results=responses, count=len(responses))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Batch image translation error: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to process images: {str(e)}")
+
+
 @router.post(
     "/detect-language",
     response_model=LanguageDetectionResponse,
@@ -322,8 +1131,7 @@ async def detect_language(text: str = Form(...)) -> LanguageDetectionResponse:
     """Detect the language of input text."""
     try:
         if GOOGLETRANS_AVAILABLE:
-            translator = GoogleTransAPI()
-            detection = translator.detect(text)
+            detection = await run_blocking(TRANSLATE_EXECUTOR, _detect_with_googletrans, text)
             detected_code = detection.lang
             confidence = detection.confidence
         else:
@@ -342,12 +1150,7 @@ async def detect_language(text: str = Form(...)) -> LanguageDetectionResponse:
         raise HTTPException(status_code=500, detail=f"Language detection failed: {str(e)}")
 
 
-@router.get("/status", summary="Check translation service status")
-async def get_translation_status():
-    """
-    Returns the status of translation services and dependencies.
-    """
-    
+def _build_status(available: bool, ready: bool) -> dict:
     return {
         "text_translation": {
             "available": True,
@@ -358,8 +1161,10 @@ async def get_translation_status():
             }
         },
         "image_translation": {
-            "available": OCR_AVAILABLE,
-            "engine": "EasyOCR" if OCR_AVAILABLE else None,
+            "available": available,
+            "engine": "EasyOCR" if available else None,
+            "worker_processes": OCR_PROCESSES,
+            "ready": ready,
             "installation_guide": None
         },
         "supported_languages": len(LANGUAGE_NAMES),
@@ -367,15 +1172,35 @@ async def get_translation_status():
     }
 
 
+# Everything these endpoints return is fixed at import time except OCR
+# availability and readiness, so serialise the bodies once per state
+_STATUS_JSON = {
+    (available, ready): orjson.dumps(_build_status(available, ready))
+    for available in (False, True)
+    for ready in (False, True)
+}
+_LANGUAGES_JSON = orjson.dumps({
+    "languages": [
+        {"code": code, "name": name}
+        for code, name in LANGUAGE_NAMES.items()
+    ]
+})
+
+
+@router.get("/status", summary="Check translation service status")
+async def get_translation_status():
+    """
+    Returns the status of translation services and dependencies.
+    """
+    available = ocr_available()
+    body = _STATUS_JSON[(available, available and OCR_READY.is_set())]
+    return Response(body, media_type="application/json")
+
+
 @router.get("/languages", summary="Get supported languages")
 async def get_supported_languages():
     """Returns list of supported languages."""
-    return {
-        "languages": [
-            {"code": code, "name": name}
-            for code, name in LANGUAGE_NAMES.items()
-        ]
-    }
+    return Response(_LANGUAGES_JSON, media_type="application/json")
 
 
 # Backward compatible endpoint
@@ -0,0 +1,102 @@
+"""
+Checks for the translation micro-batcher (TranslationBatcher).
+Runs offline against a fake upstream, no server needed:
+    python test_translation_batching.py
+"""
+import asyncio
+import os
+import sys
+
+# Fix Windows console encoding
+if sys.platform == "win32":
+    import codecs
+    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
+
+from routes.translation import TranslationBatcher
+
+
+class FakeUpstream:
+    """Records every upstream request; upper-cases text like a 'translation'"""
+
+    def __init__(self, drop_markers=False, fail_on=None):
+        self.calls = []
+        self.drop_markers = drop_markers
+        self.fail_on = fail_on
+
+    async def __call__(self, text, source_lang, target_lang):
+        self.calls.append(text)
+        await asyncio.sleep(0.001)
+        if self.fail_on is not None and self.fail_on in text:
+            raise RuntimeError("upstream failed")
+        if self.drop_markers:
+            text = text.replace(TranslationBatcher.MARKER, "")
+        return text.upper()
+
+
+def make_batcher(upstream):
+    return TranslationBatcher(upstream, window=0.005, max_items=32, max_chars=5000)
+
+
+async def _translate_all(batcher, texts, source_lang="en", target_lang="hi"):
+    return await asyncio.gather(
+        *(batcher.translate(text, source_lang, target_lang) for text in texts),
+        return_exceptions=True,
+    )
+
+
+def test_merges_same_language_pair():
+    upstream = FakeUpstream()
+    results = asyncio.run(_translate_all(make_batcher(upstream), ["parking", "exit", "bus stop"]))
+    assert results == ["PARKING", "EXIT", "BUS STOP"], results
+    assert len(upstream.calls) == 1, upstream.calls
+
+
+def test_split_mismatch_falls_back_to_single_calls():
+    upstream = FakeUpstream(drop_markers=True)
+    results = asyncio.run(_translate_all(make_batcher(upstream), ["left", "right"]))
+    assert results == ["LEFT", "RIGHT"], results
+    # one merged request, then one per text
+    assert len(upstream.calls) == 3, upstream.calls
+
+
+def test_upstream_failure_only_fails_affected_text():
+    upstream = FakeUpstream(fail_on="boom")
+    results = asyncio.run(_translate_all(make_batcher(upstream), ["ok", "boom"]))
+    assert results[0] == "OK", results
+    assert isinstance(results[1], RuntimeError), results
+
+
+def test_text_with_marker_is_sent_alone():
+    upstream = FakeUpstream()
+    marked = f"a {TranslationBatcher.MARKER} b"
+    results = asyncio.run(_translate_all(make_batcher(upstream), [marked, "stop"]))
+    assert results == [marked.upper(), "STOP"], results
+    assert len(upstream.calls) == 2, upstream.calls
+
+
+def test_auto_source_texts_are_not_merged():
+    upstream = FakeUpstream()
+    texts = ["வணக்கம்", "नमस्ते"]
+    results = asyncio.run(_translate_all(make_batcher(upstream), texts, source_lang="auto", target_lang="en"))
+    assert results == [text.upper() for text in texts], results
+    assert sorted(upstream.calls) == sorted(texts), upstream.calls
+
+
+if __name__ == "__main__":
+    print("=" * 80)
+    print("TRANSLATION BATCHER - Checks")
+    print("=" * 80)
+    failed = 0
+    for name, check in list(globals().items()):
+        if not name.startswith("test_"):
+            continue
+        try:
+            check()
+            print(f"[OK] {name}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[ERROR] {name}: {e}")
+    print("=" * 80)
+    sys.exit(1 if failed else 0)